@@ -0,0 +1,4 @@
+"""League of Legends ranked data pipeline.
+
+Run stages with ``python -m lol_pipeline <stage> [<stage> ...]``.
+"""
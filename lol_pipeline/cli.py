@@ -0,0 +1,88 @@
+import argparse
+import dataclasses
+import importlib
+import logging
+import time
+
+from lol_pipeline.config import load_config
+from lol_pipeline.connections import PipelineContext
+
+# Stage modules are imported only when selected, so e.g. `summoners`
+# never loads pandas.
+STAGES = {
+    "summoners": "lol_pipeline.summoners",
+    "matchids": "lol_pipeline.matchids",
+    "matches": "lol_pipeline.matches",
+    "export": "lol_pipeline.export",
+    "dimensions": "lol_pipeline.dimensions",
+}
+
+
+def positive_int(value):
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="lol-pipeline",
+        description="Run one or more pipeline stages in a single process."
+    )
+    parser.add_argument(
+        "stages",
+        nargs="+",
+        choices=list(STAGES),
+        metavar="stage",
+        help=f"stage(s) to run in order: {', '.join(STAGES)}"
+    )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        type=str.upper,
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        help="logging level (default: INFO)"
+    )
+
+    streaming = parser.add_argument_group("match pipeline tuning")
+    for flag, help_text in [
+        ("--fetch-workers", "concurrent match downloads"),
+        ("--transform-workers", "threads parsing match payloads (default 1; parsing is CPU-bound, so more threads only overlap I/O and add no throughput under the GIL)"),
+        ("--writer-workers", "threads writing batches to the database"),
+        ("--batch-size", "matches per database write/acknowledgement"),
+        ("--queue-size", "capacity of each queue between stages"),
+    ]:
+        streaming.add_argument(flag, type=positive_int, help=help_text)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    logging.basicConfig(
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        level=args.log_level
+    )
+
+    config = load_config()
+    overrides = {
+        field: getattr(args, field)
+        for field in ("fetch_workers", "transform_workers", "writer_workers", "batch_size", "queue_size")
+        if getattr(args, field) is not None
+    }
+    config = dataclasses.replace(config, **overrides)
+
+    # One connection per writer, plus the match_ids reader and the acknowledger
+    ctx = PipelineContext(config, max_db_connections=config.writer_workers + 2)
+    try:
+        for name in args.stages:
+            stage = importlib.import_module(STAGES[name])
+            started = time.perf_counter()
+            stage.run(ctx)
+            logging.info(f"⏱️ Stage '{name}' finished in {time.perf_counter() - started:.1f}s")
+    finally:
+        ctx.close()
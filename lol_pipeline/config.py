@@ -0,0 +1,70 @@
+import os
+from dataclasses import dataclass
+
+QUEUE_ID = 420
+
+regions = ["euw1", "na1", "kr", "eun1"]
+tiers = ["GOLD", "PLATINUM", "EMERALD", "DIAMOND"]
+divisions = ["I", "II", "III", "IV"]
+
+region_map = {"euw1": 3, "na1": 8, "kr": 5, "eun1": 2}
+tier_map = {"GOLD": 4, "PLATINUM": 5, "EMERALD": 6, "DIAMOND": 7}
+
+# region_id -> regional routing value used by match-v5
+routing_map = {
+    2: "europe",
+    3: "europe",
+    5: "asia",
+    8: "americas"
+}
+
+
+@dataclass(frozen=True)
+class Config:
+    api_key: str | None
+    db_host: str | None
+    db_name: str | None
+    db_user: str | None
+    db_password: str | None
+    db_port: str = "5432"
+    db_sslmode: str = "require"
+    data_dir: str = "data"
+    # Streaming match pipeline
+    fetch_workers: int = 4
+    # Parsing is CPU-bound, so extra threads only overlap with I/O (GIL)
+    transform_workers: int = 1
+    writer_workers: int = 2
+    batch_size: int = 50
+    queue_size: int = 100
+
+
+def _positive_int_env(name, default):
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}")
+    if number < 1:
+        raise ValueError(f"{name} must be at least 1, got {number}")
+    return number
+
+
+def load_config():
+    # Read secrets when a stage runs, not at import time
+    return Config(
+        api_key=os.getenv("RIOT_API_KEY"),
+        db_host=os.getenv("SUPABASE_DB_HOST"),
+        db_name=os.getenv("SUPABASE_DB_NAME"),
+        db_user=os.getenv("SUPABASE_DB_USER"),
+        db_password=os.getenv("SUPABASE_DB_PASSWORD"),
+        db_port=os.getenv("SUPABASE_DB_PORT") or "5432",
+        db_sslmode=os.getenv("SUPABASE_DB_SSLMODE", "require"),
+        data_dir=os.getenv("LOL_PIPELINE_DATA_DIR", "data"),
+        fetch_workers=_positive_int_env("LOL_PIPELINE_FETCH_WORKERS", 4),
+        transform_workers=_positive_int_env("LOL_PIPELINE_TRANSFORM_WORKERS", 1),
+        writer_workers=_positive_int_env("LOL_PIPELINE_WRITER_WORKERS", 2),
+        batch_size=_positive_int_env("LOL_PIPELINE_BATCH_SIZE", 50),
+        queue_size=_positive_int_env("LOL_PIPELINE_QUEUE_SIZE", 100),
+    )
@@ -0,0 +1,124 @@
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from lol_pipeline.config import load_config
+
+# requests and psycopg2 are imported inside the factories so that stages
+# which never touch the API or the database don't pay for them.
+
+
+class RateLimiter:
+    """Riot API limits: 20 calls/sec and 100 calls/2min, shared by all stages."""
+
+    def __init__(self, per_second=20, per_two_minutes=100):
+        self.per_second = per_second
+        self.per_two_minutes = per_two_minutes
+        self.api_calls = deque()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            while True:
+                now = time.time()
+                while self.api_calls and now - self.api_calls[0] > 120:
+                    self.api_calls.popleft()
+                if len(self.api_calls) >= self.per_two_minutes:
+                    wait = 120 - (now - self.api_calls[0])
+                    logging.warning(f"⏳ Hit {self.per_two_minutes}/2min limit, sleeping {wait:.2f}s")
+                    time.sleep(max(wait, 0))
+                    continue
+                recent = [t for t in self.api_calls if now - t < 1]
+                if len(recent) >= self.per_second:
+                    logging.warning(f"⏳ Hit {self.per_second}/sec limit, sleeping 1s")
+                    time.sleep(1)
+                    continue
+                self.api_calls.append(now)
+                return
+
+
+def create_session(config):
+    import requests
+
+    session = requests.Session()
+    session.headers["X-Riot-Token"] = config.api_key or ""
+    return session
+
+
+def create_db_pool(config, maxconn=4):
+    from psycopg2.pool import ThreadedConnectionPool
+
+    return ThreadedConnectionPool(
+        1,
+        maxconn,
+        host=config.db_host,
+        dbname=config.db_name,
+        user=config.db_user,
+        password=config.db_password,
+        port=config.db_port,
+        sslmode=config.db_sslmode
+    )
+
+
+class PipelineContext:
+    """Shared state for stages running in one process.
+
+    The HTTP session, DB pool and rate limiter are created on first use and
+    reused by every stage, so chaining stages keeps connections warm. ``cache``
+    lets one stage hand its results to the next without a DB round trip.
+    """
+
+    def __init__(self, config=None, max_db_connections=4):
+        self.config = config or load_config()
+        self.max_db_connections = max_db_connections
+        self.rate_limiter = RateLimiter()
+        self.cache = {}
+        self._session = None
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        with self._lock:
+            if self._session is None:
+                self._session = create_session(self.config)
+            return self._session
+
+    @property
+    def pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = create_db_pool(self.config, self.max_db_connections)
+            return self._pool
+
+    @contextmanager
+    def connection(self):
+        conn = self.pool.getconn()
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.pool.putconn(conn)
+
+    def riot_get(self, url, params=None, default_retry=1, timeout=10):
+        """GET a Riot API url, honouring the rate limits and 429 Retry-After."""
+        while True:
+            self.rate_limiter.wait()
+            resp = self.session.get(url, params=params, timeout=timeout)
+            if resp.status_code != 429:
+                return resp
+            retry = int(resp.headers.get("Retry-After", default_retry))
+            logging.warning(f"Rate limited. Sleeping {retry}s")
+            time.sleep(retry)
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
@@ -0,0 +1,11 @@
+import os
+
+from lol_pipeline.export import export_query_to_csv
+
+dimension_tables = ["tiers", "regions", "champions"]
+
+
+def run(ctx):
+    for table in dimension_tables:
+        output_path = os.path.join(ctx.config.data_dir, f"{table}.csv")
+        export_query_to_csv(ctx, f"SELECT * FROM {table};", output_path)
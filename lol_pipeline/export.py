@@ -0,0 +1,55 @@
+import csv
+import logging
+import os
+import tempfile
+from decimal import Decimal
+
+
+def _csv_value(value):
+    # Match the float formatting pandas used for numeric columns
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def export_query_to_csv(ctx, query, output_path, chunk_size=10000):
+    # A named (server-side) cursor streams rows in chunks, so memory stays
+    # flat however large the table or view is. Rows go to a temp file that
+    # only replaces output_path once the whole result has been written.
+    output_dir = os.path.dirname(output_path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+            # pandas wrote LF line endings; csv defaults to CRLF
+            writer = csv.writer(f, lineterminator="\n")
+            with ctx.connection() as conn:
+                cursor = conn.cursor(name="export_cursor")
+                cursor.itersize = chunk_size
+                cursor.execute(query)
+
+                rows = 0
+                header_written = False
+                while True:
+                    chunk = cursor.fetchmany(chunk_size)
+                    if not header_written:
+                        writer.writerow(col[0] for col in cursor.description)
+                        header_written = True
+                    if not chunk:
+                        break
+                    writer.writerows([_csv_value(v) for v in row] for row in chunk)
+                    rows += len(chunk)
+
+                cursor.close()
+                conn.commit()
+        # mkstemp creates the file as 0600; give it normal file permissions
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    logging.info(f"✅ Exported {rows} rows to {output_path}")
+
+
+def run(ctx):
+    output_path = os.path.join(ctx.config.data_dir, "fact_champion_stats.csv")
+    export_query_to_csv(ctx, "SELECT * FROM fact_champion_stats;", output_path)
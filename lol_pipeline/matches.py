@@ -0,0 +1,295 @@
+import json
+import logging
+import queue
+from dataclasses import dataclass
+
+from lol_pipeline.config import routing_map
+from lol_pipeline.streaming import DONE, BatchStage, OrderedAcker, Stage, raise_for_errors
+
+MATCHES_SQL = """
+    INSERT INTO matches (match_id, game_duration, game_creation, game_mode, game_type, map_id, region_id, queue_id, game_version)
+    VALUES %s
+    ON CONFLICT (match_id) DO NOTHING
+"""
+MATCHES_TEMPLATE = "(%s, %s, to_timestamp(%s / 1000), %s, %s, %s, %s, %s, %s)"
+
+PARTICIPANTS_SQL = """
+    INSERT INTO match_participants (
+        match_id, puuid, participant_id, team_id, champion_id,
+        champion_name, summoner_name, kills, deaths, assists,
+        damage_dealt, vision_score, gold_earned, total_minions_killed,
+        champ_level, win, lane, position, damage_per_minute, gold_per_minute, cs_per_minute
+    ) VALUES %s
+    ON CONFLICT DO NOTHING
+"""
+
+BANS_SQL = """
+    INSERT INTO match_bans (match_id, team_id, champion_id)
+    VALUES %s
+    ON CONFLICT DO NOTHING
+"""
+
+
+@dataclass
+class MatchTask:
+    """One match travelling through the pipeline.
+
+    ``data`` holds the raw response body after fetching and is replaced by
+    the row tuples after transforming, so the payload can be freed early.
+    """
+    seq: int
+    match_id: str
+    region_id: int
+    data: object = None
+    ok: bool = True
+
+
+def get_remaining_matches_count(conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM match_ids WHERE processed = FALSE")
+    count = cursor.fetchone()[0]
+    cursor.close()
+    return count
+
+
+def iter_unprocessed_match_ids(ctx, page_size=500):
+    # Keyset pagination: one pass over the backlog that never re-reads rows
+    # still in flight and never holds more than one page in memory.
+    last_id = ""
+    while True:
+        with ctx.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT match_id, region_id FROM match_ids
+                WHERE processed = FALSE AND match_id > %s
+                ORDER BY match_id
+                LIMIT %s
+            """, (last_id, page_size))
+            rows = cursor.fetchall()
+            cursor.close()
+            conn.commit()
+        if not rows:
+            return
+        yield from rows
+        last_id = rows[-1][0]
+
+
+def mark_matches_processed(ctx, match_ids):
+    with ctx.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("UPDATE match_ids SET processed = TRUE WHERE match_id = ANY(%s)", (list(match_ids),))
+        conn.commit()
+        cursor.close()
+
+
+def transform_match(match_data, region_id):
+    """Turn a match-v5 payload into (match_row, participant_rows, ban_rows)."""
+    match_info = {
+        "match_id": match_data["metadata"]["matchId"],
+        "game_duration": match_data["info"]["gameDuration"],
+        "game_creation": match_data["info"]["gameCreation"],
+        "game_mode": match_data["info"]["gameMode"],
+        "game_type": match_data["info"]["gameType"],
+        "map_id": match_data["info"]["mapId"],
+        "region_id": region_id,
+        "queue_id": match_data["info"]["queueId"],
+        "game_version": match_data["info"]["gameVersion"]
+    }
+
+    match_row = (
+        match_info["match_id"],
+        match_info["game_duration"],
+        match_info["game_creation"],
+        match_info["game_mode"],
+        match_info["game_type"],
+        match_info["map_id"],
+        match_info["region_id"],
+        match_info["queue_id"],
+        match_info["game_version"]
+    )
+
+    game_duration_minutes = match_info["game_duration"] / 60 if match_info["game_duration"] > 0 else 1
+
+    participant_rows = []
+    for p in match_data["info"]["participants"]:
+        total_damage = p.get("totalDamageDealtToChampions", 0)
+        gold_earned = p.get("goldEarned", 0)
+        total_minions = p.get("totalMinionsKilled", 0) + p.get("neutralMinionsKilled", 0)
+
+        damage_per_minute = total_damage / game_duration_minutes
+        gold_per_minute = gold_earned / game_duration_minutes
+        cs_per_minute = total_minions / game_duration_minutes
+
+        participant_rows.append((
+            match_info["match_id"],
+            p["puuid"],
+            p["participantId"],
+            p["teamId"],
+            p.get("championId", None),
+            p.get("championName", None),
+            p.get("summonerName", None),
+            p.get("kills", 0),
+            p.get("deaths", 0),
+            p.get("assists", 0),
+            total_damage,
+            p.get("visionScore", 0),
+            gold_earned,
+            total_minions,
+            p.get("champLevel", 0),
+            p.get("win", False),
+            p.get("lane", None),
+            p.get("individualPosition", None),
+            damage_per_minute,
+            gold_per_minute,
+            cs_per_minute
+        ))
+
+    ban_rows = []
+    for team in match_data["info"].get("teams", []):
+        team_id = team["teamId"]
+        for ban in team.get("bans", []):
+            ban_rows.append((
+                match_info["match_id"],
+                team_id,
+                ban["championId"]
+            ))
+
+    return match_row, participant_rows, ban_rows
+
+
+def insert_match_rows(conn, transformed):
+    """Insert the rows of several transformed matches in one round trip per table."""
+    from psycopg2.extras import execute_values
+
+    match_rows = [t[0] for t in transformed]
+    participant_rows = [row for t in transformed for row in t[1]]
+    ban_rows = [row for t in transformed for row in t[2]]
+
+    cursor = conn.cursor()
+    execute_values(cursor, MATCHES_SQL, match_rows, template=MATCHES_TEMPLATE)
+    if participant_rows:
+        execute_values(cursor, PARTICIPANTS_SQL, participant_rows)
+    if ban_rows:
+        execute_values(cursor, BANS_SQL, ban_rows)
+    cursor.close()
+
+
+def fetch_match(ctx, region_id, match_id):
+    platform = routing_map.get(region_id, "europe")
+    url = f"https://{platform}.api.riotgames.com/lol/match/v5/matches/{match_id}"
+    try:
+        resp = ctx.riot_get(url)
+        if resp.status_code == 200:
+            # Parsing is left to the transform stage
+            return resp.content
+        else:
+            logging.error(f"Failed to fetch match {match_id}: {resp.status_code} {resp.text}")
+            return None
+    except Exception as e:
+        logging.error(f"Exception fetching match {match_id}: {e}")
+        return None
+
+
+def _fail(task, exc=None):
+    task.ok = False
+    task.data = None
+    return task
+
+
+def run(ctx):
+    config = ctx.config
+    logging.info("🚀 Starting match data extraction...")
+    logging.info(
+        f"⚙️ fetch={config.fetch_workers} transform={config.transform_workers} "
+        f"write={config.writer_workers} batch={config.batch_size} queue={config.queue_size}"
+    )
+
+    with ctx.connection() as conn:
+        remaining = get_remaining_matches_count(conn)
+        conn.commit()
+    logging.info(f"🧮 Remaining unprocessed matches: {remaining}")
+    if remaining == 0:
+        logging.info("🏁 Finished all processing.")
+        return
+
+    def fetch(task):
+        task.data = fetch_match(ctx, task.region_id, task.match_id)
+        if task.data is None:
+            logging.warning(f"⚠️ Skipping match {task.match_id} due to fetch failure.")
+            return _fail(task)
+        return task
+
+    def transform(task):
+        if task.ok:
+            task.data = transform_match(json.loads(task.data), task.region_id)
+        return task
+
+    def write(batch):
+        ok = [task for task in batch if task.ok]
+        if not ok:
+            return batch
+        try:
+            with ctx.connection() as conn:
+                insert_match_rows(conn, [task.data for task in ok])
+                conn.commit()
+        except Exception as e:
+            # Retry one by one so a single bad match doesn't sink the batch
+            logging.error(f"❌ Batch insert of {len(ok)} matches failed, retrying individually: {e}")
+            for task in ok:
+                try:
+                    with ctx.connection() as conn:
+                        insert_match_rows(conn, [task.data])
+                        conn.commit()
+                except Exception as e:
+                    logging.error(f"❌ DB insert error for match {task.match_id}: {e}")
+                    _fail(task)
+        for task in batch:
+            task.data = None
+        return batch
+
+    fetch_queue = queue.Queue(maxsize=config.queue_size)
+    transform_queue = queue.Queue(maxsize=config.queue_size)
+    write_queue = queue.Queue(maxsize=config.queue_size)
+    ack_queue = queue.Queue()
+
+    acker = OrderedAcker(
+        lambda tasks: mark_matches_processed(ctx, [t.match_id for t in tasks]),
+        ack_queue,
+        window=config.queue_size * 3 + config.batch_size * config.writer_workers,
+        batch_size=config.batch_size,
+    )
+    stages = [
+        Stage("fetch", fetch, fetch_queue, transform_queue,
+              workers=config.fetch_workers, on_error=_fail),
+        Stage("transform", transform, transform_queue, write_queue,
+              workers=config.transform_workers, on_error=_fail),
+        BatchStage("write", write, write_queue, ack_queue,
+                   workers=config.writer_workers, batch_size=config.batch_size,
+                   on_error=_fail),
+    ]
+    acker.start()
+    for stage in stages:
+        stage.start()
+
+    queued = 0
+    try:
+        for seq, (match_id, region_id) in enumerate(iter_unprocessed_match_ids(ctx)):
+            # Poll so a failed stage aborts the run instead of leaving us
+            # waiting on an ack window that will never free up
+            while not acker.acquire(timeout=1.0):
+                raise_for_errors(*stages, acker)
+            fetch_queue.put(MatchTask(seq, match_id, region_id))
+            queued += 1
+    finally:
+        fetch_queue.put(DONE)
+        for stage in stages:
+            stage.join()
+        acker.join()
+    raise_for_errors(*stages, acker)
+
+    for stage in stages:
+        logging.info(f"📊 Stage '{stage.name}' handled {stage.processed} matches")
+    logging.info(
+        f"🏁 Finished all processing — {acker.succeeded}/{queued} matches processed, "
+        f"{queued - acker.succeeded} left for the next run."
+    )
@@ -0,0 +1,57 @@
+import logging
+
+from lol_pipeline.config import QUEUE_ID, routing_map
+
+
+def fetch_all_summoners(ctx):
+    with ctx.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT puuid, region_id FROM summoners;")
+        summoners = cursor.fetchall()
+        cursor.close()
+    return summoners
+
+
+def fetch_match_ids(ctx, puuid, region):
+    url = f"https://{region}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids"
+    params = {"start": 0, "count": 50, "queue": QUEUE_ID}
+    try:
+        resp = ctx.riot_get(url, params=params, default_retry=10)
+        logging.info(f"[{puuid}] → {resp.status_code}")
+        if resp.status_code == 200:
+            return resp.json()
+        else:
+            logging.warning(f"Unexpected response: {resp.text}")
+    except Exception as e:
+        logging.error(f"❌ Match ID fetch failed: {e}")
+    return []
+
+
+def run(ctx):
+    logging.info("🚀 Starting match ID fetch...")
+
+    summoners = ctx.cache.get("summoners")
+    if summoners is None:
+        summoners = fetch_all_summoners(ctx)
+    logging.info(f"🔍 Total summoners: {len(summoners)}")
+
+    with ctx.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("TRUNCATE TABLE match_ids;")
+
+        inserted = 0
+        for puuid, region_id in summoners:
+            region = routing_map.get(region_id, "europe")
+            match_ids = fetch_match_ids(ctx, puuid, region)
+
+            for match_id in match_ids:
+                cursor.execute("""
+                    INSERT INTO match_ids (match_id, puuid, region_id, queue_id)
+                    VALUES (%s, %s, %s, %s)
+                    ON CONFLICT (match_id) DO NOTHING;
+                """, (match_id, puuid, region_id, QUEUE_ID))
+                inserted += 1
+
+        conn.commit()
+        cursor.close()
+    logging.info(f"✅ DB update complete — {inserted} matches inserted")
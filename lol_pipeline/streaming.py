@@ -0,0 +1,249 @@
+import logging
+import queue
+import threading
+import time
+
+# End-of-stream marker passed down the queues
+DONE = object()
+
+
+def raise_for_errors(*parts):
+    """Re-raise the first error recorded by a stage or acknowledger."""
+    for part in parts:
+        if part.error is not None:
+            raise RuntimeError(f"pipeline stage '{part.name}' failed") from part.error
+
+
+class Stage:
+    """A pool of worker threads mapping items from ``inbox`` to ``outbox``.
+
+    ``func`` is called once per item and its return value is forwarded. If it
+    raises, ``on_error(item, exc)`` decides what to forward instead, so one bad
+    item never stalls the stream. Any other exception is recorded in ``error``;
+    the workers then discard the rest of the input so upstream stages never
+    block, and the caller is expected to check ``error`` after :meth:`join`.
+    Both queues should be bounded: a slow stage then blocks the ones upstream
+    of it.
+    """
+
+    def __init__(self, name, func, inbox, outbox, workers=1, on_error=None):
+        self.name = name
+        self.func = func
+        self.inbox = inbox
+        self.outbox = outbox
+        self.workers = workers
+        self.on_error = on_error
+        self.processed = 0
+        self.error = None
+        self._alive = 0
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def start(self):
+        self._alive = self.workers
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"{self.name}-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def join(self):
+        for thread in self._threads:
+            thread.join()
+
+    def _record(self, exc):
+        with self._lock:
+            if self.error is None:
+                self.error = exc
+        logging.error(f"❌ [{self.name}] worker failed: {exc!r}")
+
+    def _handle(self, item):
+        try:
+            return self.func(item)
+        except Exception as e:
+            if self.on_error is None:
+                raise
+            logging.error(f"❌ [{self.name}] {e}")
+            return self.on_error(item, e)
+
+    def _emit(self, item):
+        self.outbox.put(item)
+
+    def _drain(self):
+        pass
+
+    def _next(self):
+        return self.inbox.get()
+
+    def _run(self):
+        try:
+            while True:
+                item = self._next()
+                if item is None:
+                    continue
+                if item is DONE:
+                    # Let sibling workers see the marker too
+                    self.inbox.put(DONE)
+                    break
+                if self.error is not None:
+                    # Keep draining so upstream stages never block on us
+                    continue
+                try:
+                    self._emit(self._handle(item))
+                except Exception as e:
+                    self._record(e)
+                    continue
+                with self._lock:
+                    self.processed += 1
+            self._drain()
+        except Exception as e:
+            self._record(e)
+        finally:
+            # The last worker out always ends the stream downstream
+            with self._lock:
+                self._alive -= 1
+                last = self._alive == 0
+            if last:
+                self.outbox.put(DONE)
+
+
+class BatchStage(Stage):
+    """Like :class:`Stage`, but ``func`` receives lists of up to ``batch_size``
+    items and returns a list of results.
+
+    A partial batch is flushed once the inbox has been idle for
+    ``flush_interval`` seconds, so low traffic doesn't hold items back.
+    """
+
+    def __init__(self, name, func, inbox, outbox, workers=1, batch_size=50,
+                 flush_interval=1.0, on_error=None):
+        super().__init__(name, func, inbox, outbox, workers, on_error)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._local = threading.local()
+
+    def _batch(self):
+        if not hasattr(self._local, "batch"):
+            self._local.batch = []
+        return self._local.batch
+
+    def _next(self):
+        try:
+            return self.inbox.get(timeout=self.flush_interval)
+        except queue.Empty:
+            try:
+                self._flush()
+            except Exception as e:
+                self._record(e)
+            return None
+
+    def _emit(self, item):
+        pass
+
+    def _handle(self, item):
+        batch = self._batch()
+        batch.append(item)
+        if len(batch) >= self.batch_size:
+            self._flush()
+
+    def _drain(self):
+        self._flush()
+
+    def _flush(self):
+        batch = self._batch()
+        if not batch:
+            return
+        self._local.batch = []
+        if self.error is not None:
+            return
+        try:
+            results = self.func(batch)
+        except Exception as e:
+            if self.on_error is None:
+                raise
+            logging.error(f"❌ [{self.name}] {e}")
+            results = [self.on_error(item, e) for item in batch]
+        for result in results:
+            self.outbox.put(result)
+
+
+class OrderedAcker:
+    """Acknowledges items strictly in ``seq`` order.
+
+    Items finish out of order; they are held until every earlier ``seq`` has
+    finished, then handed to ``func`` in batches (successful ones only, judged
+    by ``item.ok``). ``window`` caps how many items may be in flight between
+    the producer calling :meth:`acquire` and their acknowledgement, which keeps
+    memory constant regardless of backlog size. An unexpected exception is
+    recorded in ``error`` like :class:`Stage` does.
+    """
+
+    name = "acknowledge"
+
+    def __init__(self, func, inbox, window=200, batch_size=50, flush_interval=1.0):
+        self.func = func
+        self.inbox = inbox
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.acked = 0
+        self.succeeded = 0
+        self.error = None
+        self._window = threading.BoundedSemaphore(window)
+        self._next_seq = 0
+        self._pending = {}
+        self._ready = []
+        self._thread = None
+
+    def acquire(self, timeout=None):
+        return self._window.acquire(timeout=timeout)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="acker", daemon=True)
+        self._thread.start()
+        return self
+
+    def join(self):
+        self._thread.join()
+
+    def _run(self):
+        try:
+            self._ack_loop()
+        except Exception as e:
+            self.error = e
+            logging.error(f"❌ [{self.name}] failed: {e!r}")
+
+    def _ack_loop(self):
+        started = time.perf_counter()
+        while True:
+            try:
+                item = self.inbox.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._flush()
+                continue
+            if item is DONE:
+                break
+            self._pending[item.seq] = item
+            while self._next_seq in self._pending:
+                done = self._pending.pop(self._next_seq)
+                self._next_seq += 1
+                if done.ok:
+                    self._ready.append(done)
+                self.acked += 1
+                self._window.release()
+            if len(self._ready) >= self.batch_size:
+                self._flush()
+                elapsed = time.perf_counter() - started
+                logging.info(f"📈 {self.acked} acknowledged ({self.acked / elapsed:.1f}/s)")
+        self._flush()
+        if self._pending:
+            logging.warning(f"⚠️ {len(self._pending)} items finished out of order were never acknowledged")
+
+    def _flush(self):
+        if not self._ready:
+            return
+        ready, self._ready = self._ready, []
+        try:
+            self.func(ready)
+            self.succeeded += len(ready)
+        except Exception as e:
+            logging.error(f"❌ Failed to acknowledge {len(ready)} items: {e}")
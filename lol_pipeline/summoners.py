@@ -0,0 +1,107 @@
+import logging
+import time
+
+from lol_pipeline.config import divisions, region_map, regions, tier_map, tiers
+
+
+def get_summoners(ctx, region, tier, divisions, max_count=20):
+    base_url = f"https://{region}.api.riotgames.com"
+    summoner_entries = []
+    seen_ids = set()
+
+    for division in divisions:
+        for page in range(1, 6):
+            url = f"{base_url}/lol/league/v4/entries/RANKED_SOLO_5x5/{tier}/{division}?page={page}"
+
+            try:
+                resp = ctx.riot_get(url)
+                logging.info(f"[{region} - {tier} {division} p{page}] → {resp.status_code}")
+                entries = resp.json()
+
+                if not isinstance(entries, list):
+                    logging.warning(f"Unexpected response: {entries}")
+                    continue
+
+                for entry in entries:
+                    sid = entry.get("summonerId")
+                    if sid and sid not in seen_ids:
+                        # Fetch puuid using summoner-v4 API
+                        summoner_url = f"{base_url}/lol/summoner/v4/summoners/{sid}"
+                        try:
+                            summoner_resp = ctx.riot_get(summoner_url)
+                            if summoner_resp.status_code == 200:
+                                summoner_data = summoner_resp.json()
+                                puuid = summoner_data.get("puuid")
+                                if puuid:
+                                    summoner_entries.append({
+                                        "region": region,
+                                        "tier": tier,
+                                        "division": division,
+                                        "summonerId": sid,
+                                        "puuid": puuid
+                                    })
+                                    seen_ids.add(sid)
+                                    if len(seen_ids) >= max_count:
+                                        break
+                        except Exception as e:
+                            logging.error(f"❌ Failed to fetch summoner details for {sid}: {e}")
+                if len(seen_ids) >= max_count:
+                    break
+            except Exception as e:
+                logging.error(f"❌ Request failed for {url}: {e}")
+                time.sleep(5)
+
+    logging.info(f"✅ {len(summoner_entries)} summoners fetched from {region} {tier}")
+    return summoner_entries
+
+
+def upsert_summoner(cursor, summoner):
+    insert_sql = """
+    INSERT INTO summoners (region_id, tier_id, division, summoner_id, puuid)
+    VALUES (%s, %s, %s, %s, %s)
+    ON CONFLICT (summoner_id) DO UPDATE
+    SET puuid = EXCLUDED.puuid,
+        division = EXCLUDED.division,
+        region_id = EXCLUDED.region_id,
+        tier_id = EXCLUDED.tier_id;
+    """
+    cursor.execute(insert_sql, (
+        region_map[summoner["region"]],
+        tier_map[summoner["tier"]],
+        summoner["division"],
+        summoner["summonerId"],
+        summoner["puuid"]
+    ))
+
+
+def run(ctx):
+    all_summoners = []
+    logging.info("🚀 Starting summoner fetch...")
+
+    for region in regions:
+        for tier in tiers:
+            logging.info(f"📡 Fetching: {region} - {tier}")
+            summoners = get_summoners(ctx, region, tier, divisions, max_count=20)
+            all_summoners.extend(summoners)
+
+    logging.info(f"🔍 Total summoners fetched: {len(all_summoners)}")
+
+    with ctx.connection() as conn:
+        cursor = conn.cursor()
+
+        logging.info("🧹 Truncating summoners table...")
+        cursor.execute("TRUNCATE TABLE summoners")
+
+        logging.info("🛠️ Inserting into database...")
+        inserted = 0
+        for summoner in all_summoners:
+            upsert_summoner(cursor, summoner)
+            inserted += 1
+        conn.commit()
+        cursor.close()
+    logging.info(f"✅ DB update complete — {inserted} rows inserted")
+
+    # Let a chained `matchids` stage skip re-reading the table
+    ctx.cache["summoners"] = [
+        (s["puuid"], region_map[s["region"]]) for s in all_summoners
+    ]
@@ -0,0 +1,117 @@
+import json
+import threading
+from contextlib import contextmanager
+
+from lol_pipeline.config import Config
+
+
+def match_payload(match_id):
+    return json.dumps({
+        "metadata": {"matchId": match_id},
+        "info": {
+            "gameDuration": 1800,
+            "gameCreation": 1700000000000,
+            "gameMode": "CLASSIC",
+            "gameType": "MATCHED_GAME",
+            "mapId": 11,
+            "queueId": 420,
+            "gameVersion": "14.12.1",
+            "participants": [
+                {"puuid": f"p{i}", "participantId": i, "teamId": 100 if i <= 5 else 200}
+                for i in range(1, 11)
+            ],
+            "teams": [{"teamId": 100, "bans": [{"championId": 1}]}],
+        },
+    }).encode()
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b""):
+        self.status_code = status_code
+        self.content = content
+        self.text = content.decode(errors="replace")
+        self.headers = {}
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self._result = []
+
+    def execute(self, sql, params=None):
+        if sql.lstrip().startswith("SELECT COUNT(*)"):
+            self._result = [(len(self.db.unprocessed()),)]
+        elif "FROM match_ids" in sql:
+            last_id, limit = params
+            rows = [(m, 3) for m in self.db.unprocessed() if m > last_id]
+            self._result = rows[:limit]
+        elif sql.lstrip().startswith("UPDATE match_ids"):
+            self.db.mark(params[0])
+        else:
+            raise AssertionError(f"unexpected SQL: {sql}")
+
+    def fetchone(self):
+        return self._result[0]
+
+    def fetchall(self):
+        return list(self._result)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self):
+        return FakeCursor(self.db)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class FakeDB:
+    """The slice of ``match_ids`` the match pipeline reads and updates."""
+
+    def __init__(self, match_ids):
+        self.match_ids = sorted(match_ids)
+        self.processed = set()
+        # Every UPDATE match_ids call, in the order it was executed
+        self.updates = []
+        self._lock = threading.Lock()
+
+    def unprocessed(self):
+        with self._lock:
+            return [m for m in self.match_ids if m not in self.processed]
+
+    def mark(self, match_ids):
+        with self._lock:
+            self.updates.append(list(match_ids))
+            self.processed.update(match_ids)
+
+    def acked_in_order(self):
+        return [m for update in self.updates for m in update]
+
+
+class FakeContext:
+    """Stands in for PipelineContext: no network, no database."""
+
+    def __init__(self, match_ids, responses=None, **config):
+        self.db = FakeDB(match_ids)
+        self.config = Config(None, None, None, None, None, **config)
+        # match_id -> FakeResponse; anything else gets a valid payload
+        self.responses = responses or {}
+
+    @contextmanager
+    def connection(self):
+        yield FakeConnection(self.db)
+
+    def riot_get(self, url, params=None, **kwargs):
+        match_id = url.rsplit("/", 1)[1]
+        if match_id in self.responses:
+            return self.responses[match_id]
+        return FakeResponse(200, match_payload(match_id))
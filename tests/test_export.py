@@ -0,0 +1,66 @@
+from contextlib import contextmanager
+from decimal import Decimal
+
+import pytest
+
+from lol_pipeline.export import export_query_to_csv
+
+
+class FakeNamedCursor:
+    def __init__(self, chunks, fail_after=None):
+        self.chunks = list(chunks)
+        self.fail_after = fail_after
+        self.description = None
+        self.itersize = None
+        self.fetched = 0
+
+    def execute(self, query):
+        pass
+
+    def fetchmany(self, size):
+        self.description = [("name",), ("dmg",), ("win",), ("x",), ("n",)]
+        if self.fail_after is not None and self.fetched >= self.fail_after:
+            raise RuntimeError("connection lost")
+        self.fetched += 1
+        return self.chunks.pop(0) if self.chunks else []
+
+    def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    @contextmanager
+    def connection(self):
+        conn = type("Conn", (), {})()
+        conn.cursor = lambda name=None: self.cursor
+        conn.commit = lambda: None
+        yield conn
+
+
+ROWS = [[("Aatrox", Decimal("13699.00"), True, None, 3)], [("Kaï'Sa", Decimal("0.5345"), False, "a,b", 4)]]
+
+
+def test_export_matches_pandas_csv_format(tmp_path):
+    out = tmp_path / "stats.csv"
+
+    export_query_to_csv(FakeContext(FakeNamedCursor(ROWS)), "q", str(out))
+
+    assert out.read_bytes() == (
+        "name,dmg,win,x,n\n"
+        "Aatrox,13699.0,True,,3\n"
+        "Kaï'Sa,0.5345,False,\"a,b\",4\n"
+    ).encode("utf-8")
+
+
+def test_failed_export_keeps_previous_file(tmp_path):
+    out = tmp_path / "stats.csv"
+    out.write_text("old\n")
+
+    with pytest.raises(RuntimeError):
+        export_query_to_csv(FakeContext(FakeNamedCursor(ROWS, fail_after=1)), "q", str(out))
+
+    assert out.read_text() == "old\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["stats.csv"]
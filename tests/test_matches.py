@@ -0,0 +1,122 @@
+import random
+import threading
+import time
+
+import pytest
+
+from lol_pipeline import matches
+from tests.fakes import FakeContext, FakeResponse
+
+
+def run_with_timeout(ctx, timeout=20):
+    """Run matches.run(ctx), failing the test instead of hanging forever."""
+    outcome = {}
+
+    def target():
+        try:
+            matches.run(ctx)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "matches.run() hung"
+    if "error" in outcome:
+        raise outcome["error"]
+
+
+@pytest.fixture
+def inserted(monkeypatch):
+    """Replace the psycopg2 batch insert with one that records match ids."""
+    calls = []
+
+    def fake_insert(conn, transformed):
+        calls.append([t[0][0] for t in transformed])
+
+    monkeypatch.setattr(matches, "insert_match_rows", fake_insert)
+    return calls
+
+
+def match_ids(n):
+    return [f"EUW1_{i:05d}" for i in range(n)]
+
+
+def test_acks_reach_match_ids_in_seq_order(monkeypatch, inserted):
+    ids = match_ids(300)
+    ctx = FakeContext(ids, fetch_workers=8, writer_workers=3, batch_size=7, queue_size=5)
+
+    # Random latency so matches finish out of order
+    original = ctx.riot_get
+
+    def slow_get(url, **kwargs):
+        time.sleep(random.random() * 0.002)
+        return original(url, **kwargs)
+
+    monkeypatch.setattr(ctx, "riot_get", slow_get)
+
+    run_with_timeout(ctx)
+
+    assert ctx.db.acked_in_order() == ids
+    assert sorted(m for call in inserted for m in call) == ids
+
+
+def test_failed_fetch_and_transform_are_not_acknowledged(inserted):
+    ids = match_ids(40)
+    bad_fetch = {"EUW1_00003", "EUW1_00017"}
+    bad_payload = {"EUW1_00010", "EUW1_00031"}
+    responses = {m: FakeResponse(404, b"not found") for m in bad_fetch}
+    responses.update({m: FakeResponse(200, b"{not json") for m in bad_payload})
+    ctx = FakeContext(ids, responses=responses, batch_size=5)
+
+    run_with_timeout(ctx)
+
+    expected = [m for m in ids if m not in bad_fetch | bad_payload]
+    assert ctx.db.acked_in_order() == expected
+    assert ctx.db.unprocessed() == sorted(bad_fetch | bad_payload)
+    assert not {m for call in inserted for m in call} & (bad_fetch | bad_payload)
+
+
+def test_failed_batch_insert_falls_back_to_per_match_inserts(monkeypatch):
+    ids = match_ids(10)
+    calls = []
+
+    def flaky_insert(conn, transformed):
+        batch = [t[0][0] for t in transformed]
+        calls.append(batch)
+        if "EUW1_00004" in batch:
+            raise ValueError("bad row")
+
+    monkeypatch.setattr(matches, "insert_match_rows", flaky_insert)
+    ctx = FakeContext(ids, batch_size=10, writer_workers=1)
+
+    run_with_timeout(ctx)
+
+    assert calls[0] == ids
+    assert calls[1:] == [[m] for m in ids]
+    assert ctx.db.acked_in_order() == [m for m in ids if m != "EUW1_00004"]
+
+
+def test_raising_error_handler_fails_run_instead_of_hanging(monkeypatch, inserted):
+    ids = match_ids(50)
+    responses = {"EUW1_00002": FakeResponse(500, b"boom")}
+
+    def broken_fail(task, exc=None):
+        raise RuntimeError("on_error blew up")
+
+    monkeypatch.setattr(matches, "_fail", broken_fail)
+    ctx = FakeContext(ids, responses=responses, queue_size=1)
+
+    with pytest.raises(RuntimeError, match="pipeline stage 'fetch' failed") as excinfo:
+        run_with_timeout(ctx)
+    assert str(excinfo.value.__cause__) == "on_error blew up"
+    assert "EUW1_00002" in ctx.db.unprocessed()
+
+
+def test_empty_backlog_returns_without_starting_stages(inserted):
+    ctx = FakeContext([])
+
+    run_with_timeout(ctx)
+
+    assert ctx.db.updates == []
+    assert inserted == []
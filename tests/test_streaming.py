@@ -0,0 +1,86 @@
+import queue
+import threading
+from types import SimpleNamespace
+
+from lol_pipeline.streaming import DONE, OrderedAcker, Stage
+
+
+def item(seq, ok=True):
+    return SimpleNamespace(seq=seq, ok=ok)
+
+
+def test_window_limits_items_in_flight():
+    inbox = queue.Queue()
+    acked = []
+    acker = OrderedAcker(lambda items: acked.extend(i.seq for i in items), inbox,
+                         window=3, batch_size=1, flush_interval=0.05).start()
+
+    assert all(acker.acquire(timeout=0.1) for _ in range(3))
+    assert not acker.acquire(timeout=0.1)
+
+    # An out-of-order completion must not free a slot
+    inbox.put(item(1))
+    assert not acker.acquire(timeout=0.2)
+
+    # seq 0 releases both 0 and 1
+    inbox.put(item(0))
+    assert acker.acquire(timeout=1)
+    assert acker.acquire(timeout=1)
+    assert not acker.acquire(timeout=0.1)
+
+    inbox.put(item(2))
+    inbox.put(item(3))
+    inbox.put(item(4))
+    inbox.put(DONE)
+    acker.join()
+    assert acked == [0, 1, 2, 3, 4]
+    assert acker.error is None
+
+
+def test_acker_skips_failed_items_but_keeps_order():
+    inbox = queue.Queue()
+    acked = []
+    acker = OrderedAcker(lambda items: acked.append([i.seq for i in items]), inbox,
+                         window=10, batch_size=2, flush_interval=0.05).start()
+    for seq in (3, 1, 2, 0):
+        assert acker.acquire(timeout=1)
+        inbox.put(item(seq, ok=seq != 2))
+    inbox.put(DONE)
+    acker.join()
+
+    assert [seq for batch in acked for seq in batch] == [0, 1, 3]
+    assert acker.acked == 4
+
+
+def test_stage_without_error_handler_records_error_and_ends_stream():
+    inbox = queue.Queue(maxsize=2)
+    outbox = queue.Queue()
+
+    def explode(x):
+        if x == 3:
+            raise ValueError("bad item")
+        return x
+
+    stage = Stage("explode", explode, inbox, outbox, workers=2).start()
+
+    # Upstream keeps producing after the failure without blocking
+    def produce():
+        for x in range(20):
+            inbox.put(x)
+        inbox.put(DONE)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    producer.join(5)
+    stage.join()
+
+    assert not producer.is_alive()
+    assert isinstance(stage.error, ValueError)
+    results = []
+    while True:
+        out = outbox.get(timeout=1)
+        if out is DONE:
+            break
+        results.append(out)
+    assert 3 not in results
+    assert outbox.empty()